@@ -0,0 +1,78 @@
+# scraper/bench_startup.py
+"""Mide el coste de arranque de cada scraper, en procesos nuevos.
+
+- import: python -c "import <módulo>" (intérprete + imports de módulo)
+- noop:   python run.py <fuente> sin configuración (ruta rápida)
+
+Si alguna ejecución falla, la celda se marca como FALLO, se muestra su stderr
+y el script termina con código 1: esas cifras no valen para decidir nada.
+
+Uso: python scraper/bench_startup.py [-n 10]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from run import SOURCES
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CONFIG_VARS = ("SUPABASE_URL", "SUPABASE_SERVICE_ROLE", "PLACSP_FEEDS",
+               "STRICT_FILTER", "MAX_ITEMS")
+
+
+def _clean_env() -> dict:
+    env = {k: v for k, v in os.environ.items() if k not in CONFIG_VARS}
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return env
+
+
+def time_cmd(args, runs: int):
+    """Mediana en ms de lanzar `args` `runs` veces, o (None, stderr) si alguna falla."""
+    env = _clean_env()
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        r = subprocess.run(args, cwd=HERE, env=env, stdout=subprocess.DEVNULL,
+                           stderr=subprocess.PIPE, check=False)
+        elapsed = (time.perf_counter() - t0) * 1000
+        if r.returncode != 0:
+            return None, r.stderr.decode("utf-8", "replace").strip()
+        samples.append(elapsed)
+    return statistics.median(samples), None
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__,
+                                 formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("-n", "--runs", type=int, default=10)
+    args = ap.parse_args()
+
+    py = sys.executable
+    failures = []
+
+    def cell(label, cmd):
+        ms, err = time_cmd(cmd, args.runs)
+        if ms is None:
+            failures.append((label, " ".join(cmd), err))
+            return "FALLO"
+        return f"{ms:.1f}"
+
+    baseline = cell("python", [py, "-c", "pass"])
+    print(f"{'fuente':<8} {'import (ms)':>12} {'noop (ms)':>10}")
+    print(f"{'python':<8} {baseline:>12} {baseline:>10}")
+    for source, (module_name, _, _) in SOURCES.items():
+        imp = cell(f"{source}/import", [py, "-c", f"import {module_name}"])
+        noop = cell(f"{source}/noop", [py, "run.py", source])
+        print(f"{source:<8} {imp:>12} {noop:>10}")
+
+    for label, cmd, err in failures:
+        print(f"\n[FALLO] {label}: {cmd}\n{err}", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
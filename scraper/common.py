@@ -0,0 +1,89 @@
+# scraper/common.py
+# Configuración compartida de los scrapers. Sólo usa la stdlib para que
+# comprobar si hay trabajo que hacer cueste milisegundos: requests, bs4 y
+# lxml se importan más tarde, dentro de cada scraper.
+# (Ni dataclasses ni typing: sólo importarlos ya cuesta más que el resto.)
+import os
+import sys
+
+
+class Config:
+    __slots__ = ("supabase_url", "service_role", "placsp_feeds", "strict_filter", "max_items")
+
+    def __init__(self, supabase_url: str = "", service_role: str = "",
+                 placsp_feeds: tuple = (), strict_filter: bool = True, max_items: int = 200):
+        self.supabase_url = supabase_url
+        self.service_role = service_role
+        self.placsp_feeds = placsp_feeds
+        self.strict_filter = strict_filter
+        self.max_items = max_items
+
+    @property
+    def has_supabase(self) -> bool:
+        return bool(self.supabase_url and self.service_role)
+
+    def rpc_url(self, name: str) -> str:
+        return f"{self.supabase_url}/rest/v1/rpc/{name}"
+
+    def rest_url(self, table: str) -> str:
+        return f"{self.supabase_url}/rest/v1/{table}"
+
+    def supabase_headers(self, **extra: str) -> dict:
+        headers = {
+            "apikey": self.service_role,
+            "Authorization": f"Bearer {self.service_role}",
+            "Content-Type": "application/json",
+        }
+        headers.update(extra)
+        return headers
+
+
+def _split_feeds(raw: str) -> tuple:
+    return tuple(u.strip() for u in (raw or "").split(",") if u.strip())
+
+
+def load_config(env=None) -> Config:
+    """Lee y valida las variables de entorno una sola vez."""
+    env = os.environ if env is None else env
+    max_items = (env.get("MAX_ITEMS") or "200").strip()
+    try:
+        max_items_n = int(max_items)
+    except ValueError:
+        raise SystemExit(f"MAX_ITEMS no es un entero: {max_items!r}")
+    return Config(
+        supabase_url=(env.get("SUPABASE_URL") or "").strip().rstrip("/"),
+        service_role=(env.get("SUPABASE_SERVICE_ROLE") or "").strip(),
+        placsp_feeds=_split_feeds(env.get("PLACSP_FEEDS", "")),
+        strict_filter=env.get("STRICT_FILTER", "true").strip().lower() == "true",
+        max_items=max_items_n,
+    )
+
+
+# Qué necesita cada requisito para que merezca la pena arrancar el scraper
+REQUIREMENTS = {
+    "supabase": ("Faltan credenciales Supabase (SUPABASE_URL / SUPABASE_SERVICE_ROLE)",
+                 lambda cfg: cfg.has_supabase),
+    "placsp_feeds": ("Falta PLACSP_FEEDS (lista separada por comas con URLs de feeds Atom/RSS de la PLACSP)",
+                     lambda cfg: bool(cfg.placsp_feeds)),
+}
+
+
+def missing(cfg: Config, requires) -> list:
+    """Devuelve los mensajes de los requisitos que no se cumplen."""
+    return [REQUIREMENTS[r][0] for r in requires if not REQUIREMENTS[r][1](cfg)]
+
+
+def report_missing(cfg: Config, tag: str, requires) -> bool:
+    """Imprime lo que falta para `tag`; True si no hay nada que hacer."""
+    problems = missing(cfg, requires)
+    for p in problems:
+        print(f"[{tag}] {p}")
+    if problems:
+        print(f"[{tag}] Nada que hacer, se omite.")
+    return bool(problems)
+
+
+def exit_if_noop(cfg: Config, tag: str, requires) -> None:
+    """Ruta rápida: si falta configuración no hay nada que hacer, salimos con 0."""
+    if report_missing(cfg, tag, requires):
+        sys.exit(0)
@@ -0,0 +1,40 @@
+# scraper/run.py
+# Punto de entrada común: python scraper/run.py <fuente> [<fuente> ...]
+# Valida la configuración antes de importar el scraper (y con él requests,
+# bs4, lxml), de modo que una fuente sin credenciales o sin feeds termina en
+# milisegundos.
+import importlib
+import sys
+
+from common import load_config, report_missing
+
+# fuente -> (módulo, etiqueta de log, requisitos)
+SOURCES = {
+    "ted":    ("scraper_radar",         "TED",    ("supabase",)),
+    "boe":    ("scraper_spain_boe",     "BOE",    ("supabase",)),
+    "ccaa":   ("scraper_spain_ccaa",    "CCAA",   ("supabase",)),
+    "placsp": ("scraper_spain_placsp",  "PLACSP", ("supabase", "placsp_feeds")),
+}
+
+
+def run(source: str, cfg) -> None:
+    module_name, tag, requires = SOURCES[source]
+    if report_missing(cfg, tag, requires):
+        return
+    importlib.import_module(module_name).main(cfg)
+
+
+def main(argv=None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    unknown = [s for s in argv if s not in SOURCES]
+    if not argv or unknown:
+        print(f"Uso: run.py <{'|'.join(SOURCES)}> [...]", file=sys.stderr)
+        sys.exit(2)
+
+    cfg = load_config()
+    for source in argv:
+        run(source, cfg)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,12 @@
-import os, requests, re, datetime as dt
+import re, datetime as dt
 import xml.etree.ElementTree as ET
 
-# ====== Config ======
-SUPABASE_URL = os.environ["SUPABASE_URL"].rstrip("/")
-SERVICE_ROLE = os.environ["SUPABASE_SERVICE_ROLE"]
+import requests
+
+from common import exit_if_noop, load_config
 
-# RPCs en Supabase
-RPC_UPSERT_TENDER = f"{SUPABASE_URL}/rest/v1/rpc/upsert_tender"
-RPC_ASSIGN_CATS   = f"{SUPABASE_URL}/rest/v1/rpc/assign_categories_from_keywords"
+# ====== Config ======
+REQUIRES = ("supabase",)
 
 # Sólo TED (ES) en Atom; son anuncios reales
 SOURCES = [
@@ -28,12 +27,6 @@ HTTP_HEADERS = {
     "Accept": "application/atom+xml, application/xml, text/xml, */*",
 }
 
-SB_HEADERS = {
-    "apikey": SERVICE_ROLE,
-    "Authorization": f"Bearer {SERVICE_ROLE}",
-    "Content-Type": "application/json",
-}
-
 # ====== Utils ======
 def fetch(url: str) -> bytes:
     r = requests.get(url, headers=HTTP_HEADERS, timeout=45, allow_redirects=True)
@@ -62,7 +55,7 @@ def parse_date(s: str):
     try: return dt.datetime.fromisoformat(s.replace("Z","+00:00"))
     except Exception: return dt.datetime.utcnow()
 
-def upsert_tender(source_code, external_id, title, summary, url, published_at):
+def upsert_tender(cfg, source_code, external_id, title, summary, url, published_at):
     payload = {
         "p_source_code": source_code,                   # 'TED'
         "p_external_id": external_id,                   # usamos el propio link como id externo
@@ -80,17 +73,21 @@ def upsert_tender(source_code, external_id, title, summary, url, published_at):
         "p_published": (published_at or dt.datetime.utcnow()).isoformat(),
         "p_deadline": None
     }
-    r = requests.post(RPC_UPSERT_TENDER, headers=SB_HEADERS, json=payload, timeout=45)
+    r = requests.post(cfg.rpc_url("upsert_tender"), headers=cfg.supabase_headers(), json=payload, timeout=45)
     r.raise_for_status()
     data = r.json()
     return data[0] if isinstance(data, list) else data
 
-def assign_categories(tender_id):
-    r = requests.post(RPC_ASSIGN_CATS, headers=SB_HEADERS, json={"p_tender_id": tender_id}, timeout=30)
+def assign_categories(cfg, tender_id):
+    r = requests.post(cfg.rpc_url("assign_categories_from_keywords"), headers=cfg.supabase_headers(), json={"p_tender_id": tender_id}, timeout=30)
     r.raise_for_status()
 
 # ====== Main ======
-def main():
+def main(cfg=None):
+    if cfg is None:
+        cfg = load_config()
+        exit_if_noop(cfg, "TED", REQUIRES)
+
     total = 0
     for source_code, url in SOURCES:
         try:
@@ -116,8 +113,8 @@ def main():
             published = parse_date(pub)
             external_id = link or (title[:32] + str(abs(hash(title+summary)) % 10**8))
             try:
-                tid = upsert_tender(source_code, external_id, title, summary, link, published)
-                assign_categories(tid)
+                tid = upsert_tender(cfg, source_code, external_id, title, summary, link, published)
+                assign_categories(cfg, tid)
                 total += 1
                 print("Upserted:", source_code, tid, title[:100])
             except Exception as e:
@@ -1,20 +1,16 @@
 # scraper/scraper_spain_boe.py
-import os
 import re
 import sys
 import json
-import time
-import math
 import uuid
-import html
 import datetime as dt
 from typing import List, Dict, Optional
 
 import requests
-from bs4 import BeautifulSoup
 
-SUPABASE_URL = os.environ.get("SUPABASE_URL")
-SUPABASE_SERVICE_ROLE = os.environ.get("SUPABASE_SERVICE_ROLE")
+from common import exit_if_noop, load_config
+
+REQUIRES = ("supabase",)
 
 UA = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Radar-BOE/1.0",
@@ -43,16 +39,11 @@ KEYWORDS = [
     "cloud", "nube", "ciberseguridad", "redes", "datacenter",
 ]
 
-def supa_insert(rows: List[Dict]) -> int:
+def supa_insert(cfg, rows: List[Dict]) -> int:
     if not rows:
         return 0
-    url = f"{SUPABASE_URL}/rest/v1/public_tenders"
-    headers = {
-        "apikey": SUPABASE_SERVICE_ROLE,
-        "Authorization": f"Bearer {SUPABASE_SERVICE_ROLE}",
-        "Content-Type": "application/json",
-        "Prefer": "return=representation",
-    }
+    url = cfg.rest_url("public_tenders")
+    headers = cfg.supabase_headers(Prefer="return=representation")
     r = SESSION.post(url, headers=headers, data=json.dumps(rows))
     if r.status_code not in (200, 201):
         print("[BOE] Supabase insert error:", r.status_code, r.text[:500], file=sys.stderr)
@@ -85,6 +76,9 @@ def build_boe_day_urls(day: dt.date) -> Dict[str, str]:
     }
 
 def parse_sumario(html_text: str, day: dt.date) -> List[Dict]:
+    # bs4 + lxml son lo más pesado de importar; sólo los cargamos si hay HTML que parsear
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(html_text, "lxml")
 
     # Buscamos el bloque “V. Anuncios”. Suele aparecer como un <h2> con “V. Anuncios”
@@ -174,10 +168,10 @@ def process_day(day: dt.date) -> List[Dict]:
     items = parse_sumario(html_text, day)
     return items
 
-def main():
-    if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE:
-        print("[BOE] Faltan credenciales Supabase")
-        sys.exit(0)
+def main(cfg=None):
+    if cfg is None:
+        cfg = load_config()
+        exit_if_noop(cfg, "BOE", REQUIRES)
 
     today = dt.date.today()
     days_back = 7
@@ -209,7 +203,7 @@ def main():
     # Insertar por lotes de 200
     for i in range(0, len(dedup), 200):
         chunk = dedup[i:i+200]
-        ins = supa_insert(chunk)
+        ins = supa_insert(cfg, chunk)
         total_inserted += ins
         print(f"[BOE] Insertados {ins} / {len(chunk)}")
 
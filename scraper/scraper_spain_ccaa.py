@@ -1,9 +1,10 @@
 # scraper/scraper_spain_ccaa.py
-import os, sys, json, uuid, requests, datetime as dt
-from typing import List, Dict, Optional
+import sys, json, requests
+from typing import List, Dict
 
-SUPABASE_URL = os.environ.get("SUPABASE_URL")
-SUPABASE_SERVICE_ROLE = os.environ.get("SUPABASE_SERVICE_ROLE")
+from common import exit_if_noop, load_config
+
+REQUIRES = ("supabase",)
 
 UA = {
     "User-Agent": "Mozilla/5.0 Radar-CCAA/1.0",
@@ -14,26 +15,21 @@ UA = {
 SESSION = requests.Session()
 SESSION.headers.update(UA)
 
-def supa_insert(rows: List[Dict]) -> int:
+def supa_insert(cfg, rows: List[Dict]) -> int:
     if not rows:
         return 0
-    url = f"{SUPABASE_URL}/rest/v1/public_tenders"
-    headers = {
-        "apikey": SUPABASE_SERVICE_ROLE,
-        "Authorization": f"Bearer {SUPABASE_SERVICE_ROLE}",
-        "Content-Type": "application/json",
-        "Prefer": "return=representation",
-    }
+    url = cfg.rest_url("public_tenders")
+    headers = cfg.supabase_headers(Prefer="return=representation")
     r = SESSION.post(url, headers=headers, data=json.dumps(rows), timeout=60)
     if r.status_code not in (200, 201):
         print("[CCAA] Supabase insert error:", r.status_code, r.text[:500], file=sys.stderr)
         return 0
     return len(r.json())
 
-def main():
-    if not SUPABASE_URL or not SUPABASE_SERVICE_ROLE:
-        print("[CCAA] Faltan credenciales Supabase")
-        return
+def main(cfg=None):
+    if cfg is None:
+        cfg = load_config()
+        exit_if_noop(cfg, "CCAA", REQUIRES)
 
     total = 0
     rows: List[Dict] = []
@@ -58,7 +54,7 @@ def main():
             print(f"[CCAA] Error fetch {url}: {e}")
             continue
 
-    ins = supa_insert(rows)
+    ins = supa_insert(cfg, rows)
     total += ins
     print(f"[DONE] TOTAL INSERTADOS (ES-CCAA): {total}")
 
@@ -1,18 +1,12 @@
-import os, requests, re, datetime as dt, urllib.parse as up, time, random
+import re, datetime as dt, urllib.parse as up, time, random
 import xml.etree.ElementTree as ET
 
-# ====== Config ======
-SUPABASE_URL = os.environ["SUPABASE_URL"].rstrip("/")
-SERVICE_ROLE = os.environ["SUPABASE_SERVICE_ROLE"]
-PLACSP_FEEDS = os.environ.get("PLACSP_FEEDS", "").strip()
-STRICT_FILTER = os.environ.get("STRICT_FILTER", "true").lower() == "true"
-MAX_ITEMS = int(os.environ.get("MAX_ITEMS", "200"))
+import requests
 
-if not PLACSP_FEEDS:
-    raise SystemExit("Falta PLACSP_FEEDS (lista separada por comas con URLs de feeds Atom/RSS de la PLACSP)")
+from common import exit_if_noop, load_config
 
-RPC_UPSERT_TENDER = f"{SUPABASE_URL}/rest/v1/rpc/upsert_tender"
-RPC_ASSIGN_CATS   = f"{SUPABASE_URL}/rest/v1/rpc/assign_categories_from_keywords"
+# ====== Config ======
+REQUIRES = ("supabase", "placsp_feeds")
 
 # Cabeceras tipo navegador
 HTTP_HEADERS = {
@@ -23,12 +17,6 @@ HTTP_HEADERS = {
     "Connection": "keep-alive",
 }
 
-SB_HEADERS = {
-    "apikey": SERVICE_ROLE,
-    "Authorization": f"Bearer {SERVICE_ROLE}",
-    "Content-Type": "application/json",
-}
-
 KEYWORDS = re.compile(
     r"(inteligencia artificial|ai\b|machine learning|deep learning|datos|data\b|big data|anal[ií]tica|"
     r"visualizaci[oó]n|cloud|nube|aws|azure|gcp|kubernetes|devops|software|desarrollo|"
@@ -181,7 +169,7 @@ def parse_date(s: str):
     except Exception:
         return dt.datetime.utcnow()
 
-def upsert_tender(source_code, external_id, title, summary, url, published_at):
+def upsert_tender(cfg, source_code, external_id, title, summary, url, published_at):
     payload = {
         "p_source_code": source_code,
         "p_external_id": external_id,
@@ -199,19 +187,23 @@ def upsert_tender(source_code, external_id, title, summary, url, published_at):
         "p_published": (published_at or dt.datetime.utcnow()).isoformat(),
         "p_deadline": None
     }
-    r = requests.post(RPC_UPSERT_TENDER, headers=SB_HEADERS, json=payload, timeout=60)
+    r = requests.post(cfg.rpc_url("upsert_tender"), headers=cfg.supabase_headers(), json=payload, timeout=60)
     r.raise_for_status()
     data = r.json()
     return data[0] if isinstance(data, list) else data
 
-def assign_categories(tender_id):
-    r = requests.post(RPC_ASSIGN_CATS, headers=SB_HEADERS, json={"p_tender_id": tender_id}, timeout=30)
+def assign_categories(cfg, tender_id):
+    r = requests.post(cfg.rpc_url("assign_categories_from_keywords"), headers=cfg.supabase_headers(), json={"p_tender_id": tender_id}, timeout=30)
     r.raise_for_status()
 
 # ====== Main ======
-def main():
+def main(cfg=None):
+    if cfg is None:
+        cfg = load_config()
+        exit_if_noop(cfg, "PLACSP", REQUIRES)
+
     total = 0
-    feeds = [u.strip() for u in PLACSP_FEEDS.split(",") if u.strip()]
+    feeds = cfg.placsp_feeds
     print(f"[INFO] Feeds PLACSP recibidos: {len(feeds)}")
 
     for feed_url in feeds:
@@ -233,21 +225,21 @@ def main():
 
         filtered = []
         for title, link, summary, pub in items:
-            if not STRICT_FILTER:
+            if not cfg.strict_filter:
                 filtered.append((title, link, summary, pub))
                 continue
             text = f"{title}\n{summary}"
             if KEYWORDS.search(text):
                 filtered.append((title, link, summary, pub))
 
-        print(f"[INFO] Items tras filtro (STRICT_FILTER={STRICT_FILTER}): {len(filtered)}")
+        print(f"[INFO] Items tras filtro (STRICT_FILTER={cfg.strict_filter}): {len(filtered)}")
 
-        for title, link, summary, pub in filtered[:MAX_ITEMS]:
+        for title, link, summary, pub in filtered[:cfg.max_items]:
             published = parse_date(pub)
             external_id = link or (title[:32] + str(abs(hash(title+summary)) % 10**8))
             try:
-                tid = upsert_tender("ES-PLACSP", external_id, title, summary, link, published)
-                assign_categories(tid)
+                tid = upsert_tender(cfg, "ES-PLACSP", external_id, title, summary, link, published)
+                assign_categories(cfg, tid)
                 total += 1
                 print("  [+] Upsert ES-PLACSP:", tid, "->", title[:100])
             except Exception as e: